@@ -1,85 +1,194 @@
 import os
 import sys
+import time
+import json
 import logging
+import argparse
+import random
+import functools
+import threading
 from datetime import datetime, timezone
+from typing import Optional
+
+import httpx
 from notion_client import Client
-from dotenv import load_dotenv
+from notion_client.errors import APIResponseError
+
+# Optional orjson for faster JSON serialization (falls back to stdlib)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
-# Load environment variables from .env file
-load_dotenv()
+logger = logging.getLogger("check_ready_to_post")
 
-# Configure logging
-log_level = os.getenv("LOG_LEVEL", "INFO").upper()
-logging.basicConfig(
-    level=getattr(logging, log_level, logging.INFO),
-    format="%(asctime)s [%(levelname)s] [%(filename)s:%(lineno)d] %(message)s",
-    datefmt="%Y-%m-%d %H:%M:%S"
-)
-logger = logging.getLogger(__name__)
+_bootstrapped = False
 
-def has_ready_posts():
+def _bootstrap():
     """
-    Query Notion database for posts that are Scheduled and past their Scheduled Time.
-    Returns True if any posts are ready for publication.
+    One-time environment + logging setup, called from the CLI entry point.
+    Kept out of module import so library importers (the daemon loop, tests)
+    don't pay the .env parse or have their logging config mutated.
+    """
+    global _bootstrapped
+    if _bootstrapped:
+        return
+    _bootstrapped = True
+
+    # Load environment variables from .env file — skipped entirely when the
+    # token already comes from the environment (systemd/Docker/CI), which
+    # also avoids the dotenv import cost in production.
+    if not os.environ.get("NOTION_TOKEN"):
+        from dotenv import load_dotenv
+        load_dotenv()
+
+    # Configure logging
+    log_level = os.getenv("LOG_LEVEL", "INFO").upper()
+    logging.basicConfig(
+        level=getattr(logging, log_level, logging.INFO),
+        format="%(asctime)s [%(levelname)s] [%(filename)s:%(lineno)d] %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S"
+    )
+
+@functools.lru_cache(maxsize=1)
+def get_notion_client() -> Client:
+    """
+    Return a cached Notion client so a long-lived process reuses the
+    underlying HTTP connection pool instead of re-handshaking per check.
     """
-    logger.debug("has_ready_posts() called")
-    
-    # Get environment variables
     notion_token = os.environ.get("NOTION_TOKEN")
-    db_id = os.environ.get("NOTION_DB_ID")
-    
     if not notion_token:
         logger.error("❌ NOTION_TOKEN environment variable not set")
         raise ValueError("NOTION_TOKEN is required")
-    
+
+    logger.debug("Initializing Notion client...")
+    return Client(auth=notion_token)
+
+# Transient Notion/API failures worth retrying (rate limit + server errors)
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# Short-TTL cache so bursty invocations (cron + manual + loop overlap)
+# don't each pay a Notion round-trip for an answer that can't change
+# meaningfully within a few seconds.
+READY_CACHE_TTL = float(os.environ.get("READY_CACHE_TTL", "3"))
+_ready_cache: Optional[tuple] = None  # (monotonic_timestamp, result)
+_ready_cache_lock = threading.Lock()
+
+def _query_with_retry(notion: Client, max_attempts: int = 3, base_delay: float = 1.0,
+                      max_delay: float = 30.0, **query_kwargs):
+    """
+    Call notion.databases.query with exponential backoff + jitter on
+    transient failures (429/5xx, connection errors), so a single network
+    blip doesn't kill the check until the next cron tick.
+    Honors Notion's Retry-After header when present.
+    """
+    for attempt in range(max_attempts):
+        try:
+            return notion.databases.query(**query_kwargs)
+        except APIResponseError as e:
+            if e.status not in RETRYABLE_STATUS_CODES or attempt == max_attempts - 1:
+                raise
+            retry_after = e.headers.get("Retry-After") if e.headers else None
+            if retry_after:
+                delay = float(retry_after)
+            else:
+                delay = min(max_delay, base_delay * 2 ** attempt) * (1 + random.uniform(0, 0.5))
+            logger.warning("⚠️ Notion API error %s, retrying in %.1fs (attempt %d/%d)", e.status, delay, attempt + 1, max_attempts)
+            time.sleep(delay)
+        except httpx.TransportError as e:
+            if attempt == max_attempts - 1:
+                raise
+            delay = min(max_delay, base_delay * 2 ** attempt) * (1 + random.uniform(0, 0.5))
+            logger.warning("⚠️ Notion connection error (%s), retrying in %.1fs (attempt %d/%d)", e, delay, attempt + 1, max_attempts)
+            time.sleep(delay)
+
+# Where the fetched ready-post list is persisted for the next pipeline step,
+# so the poster can consume it instead of re-querying Notion per page.
+READY_POSTS_PATH = os.environ.get("READY_POSTS_PATH", "/tmp/ready_posts.json")
+
+def _persist_ready_posts(pages):
+    """Best-effort dump of the ready pages for downstream consumption."""
+    try:
+        if ORJSON_AVAILABLE:
+            with open(READY_POSTS_PATH, "wb") as f:
+                f.write(orjson.dumps(pages))
+        else:
+            with open(READY_POSTS_PATH, "w", encoding="utf-8") as f:
+                json.dump(pages, f, ensure_ascii=False)
+        logger.debug("Persisted %d ready post(s) to %s", len(pages), READY_POSTS_PATH)
+    except OSError as e:
+        logger.warning("⚠️ Could not persist ready posts to %s: %s", READY_POSTS_PATH, e)
+
+def fetch_ready_posts(notion: Optional[Client] = None):
+    """
+    Query Notion database for posts that are Scheduled and past their Scheduled Time.
+    Returns the full list of ready pages (sorted by Scheduled Time ascending) so the
+    downstream poster can consume them without issuing its own per-page queries.
+    """
+    logger.debug("fetch_ready_posts() called")
+
+    db_id = os.environ.get("NOTION_DB_ID")
+
     if not db_id:
         logger.error("❌ NOTION_DB_ID environment variable not set")
         raise ValueError("NOTION_DB_ID is required")
-    
-    logger.debug(f"Notion Token: {notion_token[:20]}...")
-    logger.debug(f"Notion DB ID: {db_id}")
-    
-    # Initialize Notion client
-    try:
-        logger.debug("Initializing Notion client...")
-        notion = Client(auth=notion_token)
-        logger.info("✅ Notion client initialized successfully")
-    except Exception as e:
-        logger.error(f"❌ Failed to initialize Notion client: {e}", exc_info=True)
-        raise
-    
+
+    logger.debug("Notion DB ID: %s", db_id)
+
+    if notion is None:
+        notion = get_notion_client()
+
     # Calculate current time in ISO format for Notion API
-    now = datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace('+00:00', 'Z')
-    logger.debug(f"Current time (UTC): {now}")
-    
-    # Build query filter
-    query_filter = {
-        "and": [
-            {"property": "Status", "select": {"equals": "Scheduled"}},
-            {"property": "Scheduled Time", "date": {"before": now}},
-        ]
-    }
-    logger.debug(f"Query filter: {query_filter}")
+    now = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+    logger.debug("Current time (UTC): %s", now)
+
+    # Build query filter. When a Notion automation maintains a "Ready"
+    # checkbox (flipped when Scheduled Time is reached), a single-property
+    # equality check is Notion's cheapest filter — set NOTION_READY_PROP to
+    # the checkbox name to use it. Otherwise fall back to the compound
+    # Status + Scheduled Time filter.
+    ready_prop = os.environ.get("NOTION_READY_PROP")
+    if ready_prop:
+        query_filter = {"property": ready_prop, "checkbox": {"equals": True}}
+    else:
+        query_filter = {
+            "and": [
+                {"property": "Status", "select": {"equals": "Scheduled"}},
+                {"property": "Scheduled Time", "date": {"before": now}},
+            ]
+        }
+    logger.debug("Query filter: %s", query_filter)
     
     # Query Notion database
     try:
-        logger.info(f"🔍 Querying Notion database for ready posts...")
-        logger.debug(f"Database ID: {db_id}")
-        logger.debug(f"Filter: Status='Scheduled' AND Scheduled Time < {now}")
-        
-        query = notion.databases.query(
-            database_id=db_id,
-            filter=query_filter,
-            page_size=1,
-        )
+        logger.info("🔍 Querying Notion database for ready posts...")
+        logger.debug("Database ID: %s", db_id)
+        logger.debug("Filter: Status='Scheduled' AND Scheduled Time < %s", now)
         
+        query_kwargs = {
+            "database_id": db_id,
+            "filter": query_filter,
+            "sorts": [{"property": "Scheduled Time", "direction": "ascending"}],
+            "page_size": 100,
+        }
+        # When the Title property ID is known and only the existence answer
+        # matters, ask Notion to return just that property so the response
+        # body (and JSON parse cost) shrinks dramatically. Leave it unset
+        # when the poster consumes the persisted list and needs full pages.
+        title_prop_id = os.environ.get("NOTION_TITLE_PROP_ID")
+        if title_prop_id:
+            query_kwargs["filter_properties"] = [title_prop_id]
+
+        query = _query_with_retry(notion, **query_kwargs)
+
         results = query.get("results", [])
         result_count = len(results)
-        
-        logger.debug(f"Query returned {result_count} results")
-        
+
+        logger.debug("Query returned %d results", result_count)
+
         if result_count > 0:
-            logger.info(f"✅ Found {result_count} post(s) ready for publication")
+            logger.info("✅ Found %d post(s) ready for publication", result_count)
             # Log first result details at debug level
             if logger.isEnabledFor(logging.DEBUG):
                 first_result = results[0]
@@ -88,29 +197,169 @@ def has_ready_posts():
                 title_prop = properties.get("Title", {})
                 title_content = title_prop.get("title", [])
                 title = title_content[0].get("plain_text", "Untitled") if title_content else "Untitled"
-                logger.debug(f"First ready post - ID: {page_id}, Title: {title}")
-            return True
+                logger.debug("First ready post - ID: %s, Title: %s", page_id, title)
         else:
             logger.info("⚠️ No posts ready for publication")
-            return False
-            
+
+        _persist_ready_posts(results)
+        return results
+
     except Exception as e:
-        logger.error(f"❌ Failed to query Notion database: {e}", exc_info=True)
+        logger.error("❌ Failed to query Notion database: %s", e, exc_info=True)
         raise
 
+def has_ready_posts(notion: Optional[Client] = None) -> bool:
+    """
+    Boolean wrapper around fetch_ready_posts() kept for existing callers.
+    Results are cached for READY_CACHE_TTL seconds.
+    """
+    global _ready_cache
+
+    with _ready_cache_lock:
+        if _ready_cache and time.monotonic() - _ready_cache[0] < READY_CACHE_TTL:
+            logger.debug("Returning cached result (age < %ss)", READY_CACHE_TTL)
+            return _ready_cache[1]
+
+    ready = bool(fetch_ready_posts(notion))
+
+    with _ready_cache_lock:
+        _ready_cache = (time.monotonic(), ready)
+    return ready
+
+def get_next_scheduled_time() -> Optional[datetime]:
+    """
+    Query Notion for the earliest future "Scheduled Time" among Scheduled posts.
+    Returns None when nothing is scheduled.
+    """
+    db_id = os.environ.get("NOTION_DB_ID")
+    if not db_id:
+        raise ValueError("NOTION_DB_ID is required")
+
+    notion = get_notion_client()
+    now = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+    query = _query_with_retry(
+        notion,
+        database_id=db_id,
+        filter={
+            "and": [
+                {"property": "Status", "select": {"equals": "Scheduled"}},
+                {"property": "Scheduled Time", "date": {"after": now}},
+            ]
+        },
+        sorts=[{"property": "Scheduled Time", "direction": "ascending"}],
+        page_size=1,
+    )
+
+    results = query.get("results", [])
+    if not results:
+        return None
+
+    date_prop = results[0].get("properties", {}).get("Scheduled Time", {}).get("date") or {}
+    start = date_prop.get("start")
+    if not start:
+        return None
+
+    return datetime.fromisoformat(start.replace('Z', '+00:00'))
+
+def wait_until_due(max_wait_seconds: int = 3600) -> bool:
+    """
+    Sleep until the next scheduled post is due instead of blindly polling.
+    Returns True if a post came due within the window, False otherwise.
+    """
+    next_time = get_next_scheduled_time()
+
+    if next_time is None:
+        logger.info("No future posts scheduled — nothing to wait for")
+        return has_ready_posts()
+
+    delay = (next_time - datetime.now(timezone.utc)).total_seconds()
+    if delay <= 0:
+        return has_ready_posts()
+
+    if delay > max_wait_seconds:
+        logger.info("Next post due at %s (%.0fs away) — beyond max wait of %ds", next_time, delay, max_wait_seconds)
+        return has_ready_posts()
+
+    logger.info("⏰ Next post due at %s — sleeping %.0fs until then", next_time, delay)
+    time.sleep(delay)
+    return has_ready_posts()
+
+def run_loop(interval: int):
+    """
+    Long-lived polling loop for daemon-style deployments.
+    Keeps the cached Notion client (and its keep-alive connection) warm
+    across checks, and adapts the sleep to the next deadline: no point
+    polling every minute when the next post is 47 minutes away, but as a
+    deadline approaches the loop tightens to 5s for timely firing.
+    """
+    logger.info("🔁 Entering polling loop (max interval: %ds)", interval)
+    while True:
+        sleep_s = float(interval)
+        try:
+            if has_ready_posts():
+                logger.info("✅ Ready posts found")
+
+            next_time = get_next_scheduled_time()
+            if next_time is not None:
+                until_next = (next_time - datetime.now(timezone.utc)).total_seconds()
+                sleep_s = max(5.0, min(float(interval), until_next))
+        except Exception as e:
+            logger.error("❌ Check failed, will retry next interval: %s", e)
+
+        # Jitter spreads concurrent deployments so fixed-phase loops don't
+        # stampede Notion's rate limiter in lockstep.
+        sleep_s += random.uniform(0, 5)
+        logger.debug("Sleeping %.1fs until next check", sleep_s)
+        time.sleep(sleep_s)
+
 if __name__ == "__main__":
+    _bootstrap()
+
+    parser = argparse.ArgumentParser(description="Check Notion for posts ready to publish")
+    parser.add_argument(
+        "--wait",
+        action="store_true",
+        help="Sleep until the next scheduled post is due (up to --max-wait) instead of a one-shot check"
+    )
+    parser.add_argument(
+        "--loop",
+        action="store_true",
+        help="Run as a persistent polling loop instead of a one-shot check"
+    )
+    parser.add_argument(
+        "--interval",
+        type=int,
+        default=60,
+        help="Polling interval in seconds for --loop mode (default: 60)"
+    )
+    parser.add_argument(
+        "--max-wait",
+        type=int,
+        default=3600,
+        help="Maximum seconds to wait for the next scheduled post (default: 3600)"
+    )
+    args = parser.parse_args()
+
     logger.info("🚀 Starting ready post check...")
-    
+
+    if args.loop:
+        run_loop(args.interval)
+
+    # Logs carry the human-readable story; stdout carries a single
+    # machine-readable flag so callers can test $(./check_ready_to_post.py)
+    # instead of grepping for emoji.
     try:
-        if has_ready_posts():
+        ready = wait_until_due(args.max_wait) if args.wait else has_ready_posts()
+        if ready:
             logger.info("✅ Ready posts found — continuing to posting workflow")
-            print("✅ Ready posts found — continuing to X posting.")
+            sys.stdout.write("1\n")
             sys.exit(0)
         else:
             logger.warning("⚠️ No posts ready — exiting cleanly")
-            print("⚠️ No posts ready — exiting cleanly.")
+            sys.stdout.write("0\n")
             sys.exit(1)
     except Exception as e:
-        logger.critical(f"❌ Fatal error during ready post check: {e}", exc_info=True)
-        print(f"❌ Error: {e}")
+        logger.critical("❌ Fatal error during ready post check: %s", e, exc_info=True)
+        sys.stdout.write("0\n")
         sys.exit(1)
@@ -11,17 +11,23 @@ License: MIT
 """
 
 import os
+import re
 import sys
+import glob
 import json
+import hashlib
 import logging
 import argparse
+import bisect
+import sqlite3
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from typing import List, Dict, Any, Optional, Set, Tuple
 
 import arxiv
 import requests
-from dateutil import parser as date_parser
 from notion_client import Client
 from dotenv import load_dotenv
 
@@ -35,6 +41,27 @@ try:
 except ImportError:
     OPENAI_AVAILABLE = False
 
+# Optional orjson for faster JSON parsing (falls back to stdlib)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def _json_loads(raw: str) -> Any:
+    """Parse a JSON string with orjson when available, stdlib json otherwise."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+def _json_dumps(obj: Any, indent: bool = False) -> str:
+    """Serialize to JSON with orjson when available, stdlib json otherwise."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+    if indent:
+        return json.dumps(obj, ensure_ascii=False, indent=2)
+    return json.dumps(obj, ensure_ascii=False)
+
 # ==============================
 # CONFIGURATION & CONSTANTS
 # ==============================
@@ -50,6 +77,27 @@ ARXIV_CATEGORIES = ["cs.AI", "cs.LG", "cs.CL", "cs.CV"]
 ARXIV_MAX_RESULTS = 100
 ARXIV_MAX_AGE_DAYS = 7
 
+# On-disk cache for arXiv query responses (arXiv publishes once a day, so
+# repeated runs within the TTL can skip the network entirely)
+ARXIV_CACHE_DIR = os.getenv("ARXIV_CACHE_DIR", ".cache/arxiv")
+ARXIV_CACHE_TTL_HOURS = 24
+
+# Local SQLite mirror of the Notion duplicate history (incremental sync)
+NOTION_CACHE_DB = os.getenv("NOTION_CACHE_DB", "notion_cache.db")
+
+# Crash-recovery journal for Notion writes still in flight
+PENDING_WRITES_PATH = os.getenv("PENDING_WRITES_PATH", "pending_writes.jsonl")
+
+# On-disk cache for generated summaries, keyed by paper/model/prompt version
+LLM_CACHE_DIR = os.getenv("LLM_CACHE_DIR", ".cache/llm")
+RESEARCH_PROMPT_VERSION = "v3.0"  # bump when RESEARCH_PROMPT changes to invalidate cached summaries
+
+# Opt-in OpenAI Batch API path for --topk runs (~50% cheaper per token, but
+# completion can take minutes — only sensible when the run isn't latency-bound)
+OPENAI_BATCH_MODE = os.getenv("OPENAI_BATCH_MODE", "0") == "1"
+OPENAI_BATCH_POLL_SECONDS = int(os.getenv("OPENAI_BATCH_POLL_SECONDS", "60"))
+OPENAI_BATCH_TIMEOUT_SECONDS = int(os.getenv("OPENAI_BATCH_TIMEOUT_SECONDS", "3600"))
+
 # Platform-specific character limits
 MAX_X_CHARS = 280
 MAX_LINKEDIN_CHARS = 2000
@@ -62,6 +110,11 @@ RECENCY_BOOST = {
     168: 5    # 96-168h: Recent
 }
 
+# Flattened view of RECENCY_BOOST for bisect: one C-level binary search per
+# paper instead of walking the dict tier by tier (0 boost past the last tier)
+_AGE_BOUNDS = tuple(sorted(RECENCY_BOOST))
+_AGE_SCORES = tuple(RECENCY_BOOST[h] for h in _AGE_BOUNDS) + (0,)
+
 # Research-focused keywords
 INNOVATION_KEYWORDS = [
     "state-of-the-art", "SOTA", "novel", "breakthrough", "first",
@@ -69,6 +122,15 @@ INNOVATION_KEYWORDS = [
     "new", "introduces", "proposes"
 ]
 
+# Precompiled alternation so scoring counts all innovation keywords in one
+# C-level pass instead of a Python-level substring scan per keyword.
+# Longest alternative first: Python regex alternation is first-match, so
+# without the sort a short keyword could shadow a longer phrase it prefixes
+_INNOVATION_RE = re.compile(
+    r"\b(?:" + "|".join(re.escape(kw) for kw in sorted(INNOVATION_KEYWORDS, key=len, reverse=True)) + r")\b",
+    re.IGNORECASE,
+)
+
 HOT_TOPICS = [
     "llm", "large language model", "gpt", "transformer",
     "diffusion", "diffusion model",
@@ -77,6 +139,14 @@ HOT_TOPICS = [
     "multimodal", "vision-language", "vlm"
 ]
 
+# Hot topics and SOTA phrases get the same treatment as the innovation
+# keywords: one compiled alternation each (longest phrase first), so the
+# per-paper scan is a single C-level pass instead of one substring search
+# per phrase. Substring semantics are kept (no word boundaries) to match
+# the original checks.
+_HOT_TOPICS_RE = re.compile("|".join(re.escape(ht) for ht in sorted(HOT_TOPICS, key=len, reverse=True)))
+_SOTA_RE = re.compile("state-of-the-art|outperforms|surpasses|sota")
+
 PRESTIGE_ORGS = [
     "Google", "DeepMind", "Google DeepMind", "Google Research", "Google Brain",
     "OpenAI", "Meta AI", "Meta", "Facebook AI",
@@ -89,6 +159,15 @@ PRESTIGE_ORGS = [
     "NVIDIA", "NVIDIA Research"
 ]
 
+# One compiled pass over the joined author string instead of ~20 substring
+# scans per paper; matches map back to the canonical PRESTIGE_ORGS spelling.
+# Longest org first so "Google DeepMind" wins over the bare "Google"
+_PRESTIGE_RE = re.compile(
+    r"\b(" + "|".join(re.escape(org) for org in sorted(PRESTIGE_ORGS, key=len, reverse=True)) + r")\b",
+    re.IGNORECASE,
+)
+_PRESTIGE_CANON = {org.lower(): org for org in PRESTIGE_ORGS}
+
 # Logging configuration
 log_level = os.getenv("LOG_LEVEL", "INFO").upper()
 numeric_level = getattr(logging, log_level, logging.INFO)
@@ -106,7 +185,15 @@ logger = logging.getLogger(__name__)
 
 class ResearchPaper:
     """Data model for AI research papers from arXiv."""
-    
+
+    # Slot layout keeps ~100 short-lived candidate objects per run compact
+    # (no per-instance __dict__) and makes attribute access a bit faster
+    __slots__ = (
+        "title", "arxiv_id", "pdf_url", "authors", "abstract",
+        "categories", "primary_category", "published", "score", "institutions",
+        "_abstract_lower",
+    )
+
     def __init__(self, result: arxiv.Result):
         self.title = result.title.strip()
         self.arxiv_id = result.entry_id.split("/")[-1].split("v")[0]
@@ -118,15 +205,54 @@ class ResearchPaper:
         self.published = result.published
         self.score = 0.0
         self.institutions = self._extract_institutions()
+        self._abstract_lower = None
+
+    @property
+    def abstract_lower(self) -> str:
+        """Lowercased abstract, computed once and reused by the scorers."""
+        if self._abstract_lower is None:
+            self._abstract_lower = self.abstract.lower()
+        return self._abstract_lower
 
     def _extract_institutions(self) -> List[str]:
         """Extract prestige institutions from author affiliations."""
-        institutions = []
         authors_str = " ".join(self.authors)
-        for org in PRESTIGE_ORGS:
-            if org in authors_str:
-                institutions.append(org)
-        return list(set(institutions))
+        found = {
+            _PRESTIGE_CANON[m.group(1).lower()]
+            for m in _PRESTIGE_RE.finditer(authors_str)
+        }
+        return list(found)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ResearchPaper":
+        """Rebuild a paper from a cached dictionary (see to_cache_dict)."""
+        paper = cls.__new__(cls)
+        paper.title = data["title"]
+        paper.arxiv_id = data["arxiv_id"]
+        paper.pdf_url = data.get("pdf_url")
+        paper.authors = data.get("authors", [])
+        paper.abstract = data.get("abstract", "")
+        paper.categories = data.get("categories", [])
+        paper.primary_category = data.get("primary_category", "")
+        paper.published = datetime.fromisoformat(data["published"])
+        paper.score = 0.0
+        paper.institutions = paper._extract_institutions()
+        paper._abstract_lower = None
+        return paper
+
+    def to_cache_dict(self) -> Dict[str, Any]:
+        """Full-fidelity dictionary for the on-disk cache (unlike to_dict,
+        which truncates the abstract for display)."""
+        return {
+            "title": self.title,
+            "arxiv_id": self.arxiv_id,
+            "pdf_url": self.pdf_url,
+            "authors": self.authors,
+            "abstract": self.abstract,
+            "categories": self.categories,
+            "primary_category": self.primary_category,
+            "published": self.published.isoformat(),
+        }
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert paper to dictionary format."""
@@ -147,35 +273,99 @@ class ResearchPaper:
 # ARXIV FETCHING
 # ==============================
 
+# Shared arXiv API client — reuses one HTTP session across pages and makes
+# the paging behaviour (page size, inter-page delay, retries) explicit
+# instead of relying on the deprecated Search.results() defaults.
+# page_size covers a future ARXIV_MAX_RESULTS bump in one fetch, and the
+# 3.1s delay stays just above arXiv's 3s minimum-politeness window
+_ARXIV_CLIENT = arxiv.Client(page_size=200, delay_seconds=3.1, num_retries=3)
+
+def _arxiv_cache_path(query: str) -> str:
+    """Cache file for today's run of the given query."""
+    key = hashlib.blake2b(f"{query}|{ARXIV_MAX_RESULTS}".encode()).hexdigest()[:16]
+    today = datetime.now(timezone.utc).strftime("%Y%m%d")
+    return os.path.join(ARXIV_CACHE_DIR, f"arxiv-{today}-{key}.json")
+
+def _load_arxiv_cache(path: str) -> Optional[List[ResearchPaper]]:
+    """Return cached papers if the file exists and is still fresh."""
+    try:
+        age_h = (time.time() - os.path.getmtime(path)) / 3600
+        if age_h >= ARXIV_CACHE_TTL_HOURS:
+            return None
+        with open(path, encoding="utf-8") as f:
+            data = _json_loads(f.read())
+        papers = [ResearchPaper.from_dict(d) for d in data]
+        logger.info(f"📦 Loaded {len(papers)} papers from arXiv cache ({age_h:.1f}h old)")
+        return papers
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable arXiv cache {path}: {e}")
+        return None
+
+def _save_arxiv_cache(path: str, papers: List[ResearchPaper]) -> None:
+    """Persist fetched papers; also drop cache files past the TTL."""
+    try:
+        os.makedirs(ARXIV_CACHE_DIR, exist_ok=True)
+        for old in glob.glob(os.path.join(ARXIV_CACHE_DIR, "arxiv-*.json")):
+            if (time.time() - os.path.getmtime(old)) / 3600 >= ARXIV_CACHE_TTL_HOURS:
+                os.remove(old)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(_json_dumps([p.to_cache_dict() for p in papers]))
+        os.replace(tmp_path, path)
+    except Exception as e:
+        # Cache is an optimization — never let it break the fetch
+        logger.warning(f"Could not write arXiv cache {path}: {e}")
+
 def fetch_arxiv_papers() -> List[ResearchPaper]:
     """Fetch recent papers from arXiv in target categories."""
     logger.info(f"🔍 Fetching papers from arXiv (categories: {', '.join(ARXIV_CATEGORIES)})")
-    
+
     # Build query for multiple categories
-    query = " OR ".join([f"cat:{cat}" for cat in ARXIV_CATEGORIES])
-    
+    cat_query = " OR ".join([f"cat:{cat}" for cat in ARXIV_CATEGORIES])
+
+    # Cache key uses only the stable category part — the submittedDate
+    # window below moves every run and would defeat the daily cache
+    cache_path = _arxiv_cache_path(cat_query)
+    cached = _load_arxiv_cache(cache_path)
+    if cached is not None:
+        return cached
+
+    now = datetime.now(timezone.utc)
+    cutoff = now - timedelta(days=ARXIV_MAX_AGE_DAYS)
+
+    # Push the recency window into the query so arXiv only returns (and we
+    # only parse) papers inside it, instead of discarding old ones client-side
+    query = (
+        f"({cat_query}) AND "
+        f"submittedDate:[{cutoff.strftime('%Y%m%d%H%M')} TO {now.strftime('%Y%m%d%H%M')}]"
+    )
+
     search = arxiv.Search(
         query=query,
         max_results=ARXIV_MAX_RESULTS,
         sort_by=arxiv.SortCriterion.SubmittedDate,
         sort_order=arxiv.SortOrder.Descending
     )
-    
+
     papers = []
-    now = datetime.now(timezone.utc)
-    cutoff = now - timedelta(days=ARXIV_MAX_AGE_DAYS)
-    
+
     logger.info("📡 Querying arXiv API...")
-    
-    for result in search.results():
-        # Filter papers by age
+
+    for result in _ARXIV_CLIENT.results(search):
+        # Results arrive newest-first, so the first out-of-window paper
+        # means every later one is older too — stop instead of skipping
         if result.published < cutoff:
-            continue
-        
+            break
+
+
         paper = ResearchPaper(result)
         papers.append(paper)
     
     logger.info(f"✅ Fetched {len(papers)} papers from last {ARXIV_MAX_AGE_DAYS} days")
+
+    _save_arxiv_cache(cache_path, papers)
     
     if papers:
         oldest = min(p.published for p in papers)
@@ -188,7 +378,7 @@ def fetch_arxiv_papers() -> List[ResearchPaper]:
 # SCORING
 # ==============================
 
-def score_papers(papers: List[ResearchPaper], notion_recent: Optional[Set[Tuple[str, str]]] = None) -> List[ResearchPaper]:
+def score_papers(papers: List[ResearchPaper], notion_recent: Optional[Set[str]] = None) -> List[ResearchPaper]:
     """
     Score research papers by relevance, novelty, impact, and recency.
     Returns sorted list (highest score first).
@@ -213,55 +403,51 @@ def score_papers(papers: List[ResearchPaper], notion_recent: Optional[Set[Tuple[
         age_h = (now - paper.published).total_seconds() / 3600
         
         # 1. Recency boost
-        for hours, boost in RECENCY_BOOST.items():
-            if age_h < hours:
-                score += boost
-                break
-        
-        # Prepare text for keyword matching
-        title_abstract = (paper.title + " " + paper.abstract).upper()
-        abstract_lower = paper.abstract.lower()
+        score += _AGE_SCORES[bisect.bisect_right(_AGE_BOUNDS, age_h)]
         
-        # 2. SOTA detection (high impact indicator)
-        if "SOTA" in title_abstract or "state-of-the-art" in abstract_lower or \
-           "outperforms" in abstract_lower or "surpasses" in abstract_lower:
+        # Prepare text for keyword matching — the lowercase abstract is
+        # cached on the paper, so repeated scoring passes reuse it
+        abstract_lower = paper.abstract_lower
+        title_abstract = paper.title.lower() + " " + abstract_lower
+
+        # 2. SOTA detection (high impact indicator) — one compiled pass over
+        # the combined buffer covers title and abstract alike
+        if _SOTA_RE.search(title_abstract):
             score += 25
-            logger.debug(f"✨ SOTA detected: {paper.title[:50]}...")
-        
-        # 3. Innovation keyword matching
-        innovation_count = sum(1 for kw in INNOVATION_KEYWORDS if kw.upper() in title_abstract)
+            logger.debug("✨ SOTA detected: %s...", paper.title[:50])
+
+        # 3. Innovation keyword matching (single pass over the text; distinct
+        # keywords counted once, matching the old per-keyword membership test)
+        innovation_count = len(set(_INNOVATION_RE.findall(title_abstract)))
         score += innovation_count * 5
         
         if innovation_count > 0:
-            logger.debug(f"💡 {innovation_count} innovation keywords in: {paper.title[:40]}...")
+            logger.debug("💡 %d innovation keywords in: %s...", innovation_count, paper.title[:40])
         
         # 4. Hot topics boost
-        hot_topic_match = any(ht in abstract_lower for ht in HOT_TOPICS)
+        hot_topic_match = _HOT_TOPICS_RE.search(abstract_lower) is not None
         if hot_topic_match:
             score += 10
-            logger.debug(f"🔥 Hot topic detected: {paper.title[:40]}...")
+            logger.debug("🔥 Hot topic detected: %s...", paper.title[:40])
         
         # 5. Prestige organization boost
         if paper.institutions:
             score += len(paper.institutions) * 20
-            logger.debug(f"🏛️ Prestige orgs ({', '.join(paper.institutions)}): {paper.title[:40]}...")
+            logger.debug("🏛️ Prestige orgs (%s): %s...", ", ".join(paper.institutions), paper.title[:40])
         
         # 6. Abstract quality filter
         if len(paper.abstract) < 300:
             score -= 15
-            logger.debug(f"⚠️ Short abstract penalty ({len(paper.abstract)} chars): {paper.title[:40]}...")
+            logger.debug("⚠️ Short abstract penalty (%d chars): %s...", len(paper.abstract), paper.title[:40])
         
         # 7. Category boost (prefer core AI/ML)
         if paper.primary_category in ["cs.AI", "cs.LG"]:
             score += 3
         
-        # 8. Check for duplicates in Notion
-        if notion_recent:
-            for _, notion_arxiv_id in notion_recent:
-                if notion_arxiv_id and notion_arxiv_id == paper.arxiv_id:
-                    score -= 100
-                    logger.debug(f"❌ Duplicate arXiv ID ({paper.arxiv_id}): -{100}pts")
-                    break
+        # 8. Check for duplicates in Notion (O(1) set membership)
+        if notion_recent and paper.arxiv_id in notion_recent:
+            score -= 100
+            logger.debug("❌ Duplicate arXiv ID (%s): -100pts", paper.arxiv_id)
         
         paper.score = score
     
@@ -314,60 +500,146 @@ Guidelines:
 - Do NOT include URLs in character counts (append separately)
 - Keep X version under 280 chars, LinkedIn under 2000 chars"""
 
+# Module-level OpenAI client, created once and reused so the underlying
+# httpx connection pool keeps TLS sessions alive across summarization calls
+_openai_client = None
+_openai_client_lock = threading.Lock()
+
+def get_openai_client():
+    """Return the shared OpenAI client, creating it on first use."""
+    global _openai_client
+    if _openai_client is not None:
+        return _openai_client
+
+    with _openai_client_lock:
+        if _openai_client is not None:
+            return _openai_client
+
+        try:
+            # Temporarily clear proxy environment variables that might interfere
+            # GitHub Actions sometimes sets these which cause issues with OpenAI client
+            old_http_proxy = os.environ.pop('HTTP_PROXY', None)
+            old_https_proxy = os.environ.pop('HTTPS_PROXY', None)
+            old_http_proxy_lower = os.environ.pop('http_proxy', None)
+            old_https_proxy_lower = os.environ.pop('https_proxy', None)
+
+            try:
+                # Create client with only supported parameters
+                # Newer versions of openai library don't support 'proxies' parameter
+                _openai_client = OpenAI(
+                    api_key=OPENAI_API_KEY,
+                    timeout=30.0,  # Explicit timeout
+                    max_retries=2   # Retry on transient failures
+                )
+                logger.debug("OpenAI client initialized with model: %s", OPENAI_MODEL)
+            finally:
+                # Restore proxy environment variables
+                if old_http_proxy:
+                    os.environ['HTTP_PROXY'] = old_http_proxy
+                if old_https_proxy:
+                    os.environ['HTTPS_PROXY'] = old_https_proxy
+                if old_http_proxy_lower:
+                    os.environ['http_proxy'] = old_http_proxy_lower
+                if old_https_proxy_lower:
+                    os.environ['https_proxy'] = old_https_proxy_lower
+
+        except TypeError as e:
+            # Handle version incompatibility - try minimal initialization
+            if "proxies" in str(e) or "unexpected keyword argument" in str(e):
+                logger.warning(f"OpenAI client initialization failed with TypeError (likely version issue), using minimal params: {e}")
+                try:
+                    _openai_client = OpenAI(api_key=OPENAI_API_KEY)
+                    logger.debug("OpenAI client initialized with minimal parameters")
+                except Exception as e2:
+                    logger.error(f"Failed to initialize OpenAI client even with minimal params: {e2}")
+                    return None
+            else:
+                logger.error(f"Failed to initialize OpenAI client: {e}")
+                return None
+        except Exception as e:
+            logger.error(f"Failed to initialize OpenAI client: {e}")
+            return None
+
+        return _openai_client
+
+def _llm_cache_path(paper: ResearchPaper) -> str:
+    """
+    Cache file for this paper's summaries under the current model/prompt.
+    The abstract is part of the key so an arXiv revision (same ID, updated
+    abstract) regenerates instead of replaying the stale summary.
+    """
+    key = hashlib.blake2b(
+        f"{paper.arxiv_id}|{OPENAI_MODEL}|{RESEARCH_PROMPT_VERSION}|".encode()
+        + paper.abstract.encode()
+    ).hexdigest()[:20]
+    return os.path.join(LLM_CACHE_DIR, f"{key}.json")
+
+def _load_llm_cache(path: str) -> Optional[Dict[str, Any]]:
+    """Return a previously cached summary dict, or None."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            cached = _json_loads(f.read())
+        if cached.get("x_text") and cached.get("linkedin_text"):
+            logger.info("📦 Reusing cached LLM summary (%s)", os.path.basename(path))
+            return cached
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable LLM cache {path}: {e}")
+    return None
+
+def _save_llm_cache(path: str, result: Dict[str, Any]) -> None:
+    """Atomically persist a successful summary; never fails the caller."""
+    try:
+        os.makedirs(LLM_CACHE_DIR, exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(_json_dumps(result))
+        os.replace(tmp_path, path)
+    except Exception as e:
+        logger.warning(f"Could not write LLM cache {path}: {e}")
+
+# Strict schema for structured outputs: the API guarantees well-formed JSON
+# with exactly these keys, so parse/missing-key fallbacks become dead code in
+# practice. Length limits stay prompt-side (strict mode has no maxLength),
+# which is why the truncation guard below survives
+_SUMMARY_SCHEMA = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "paper_summary",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "x_text": {"type": "string"},
+                "linkedin_text": {"type": "string"},
+            },
+            "required": ["x_text", "linkedin_text"],
+            "additionalProperties": False,
+        },
+    },
+}
+
 def summarize_with_openai(paper: ResearchPaper) -> Dict[str, Any]:
     """Generate platform-specific summaries using OpenAI GPT-4o-mini."""
-    logger.debug(f"summarize_with_openai() called for: {paper.title[:50]}...")
-    
+    logger.debug("summarize_with_openai() called for: %s...", paper.title[:50])
+
+    # Replay a previous run's summary instead of paying LLM latency again.
+    # Checked before the availability guards so a rerun (e.g. after a
+    # Notion failure) reuses the cached text even if OpenAI is down
+    cache_path = _llm_cache_path(paper)
+    cached = _load_llm_cache(cache_path)
+    if cached is not None:
+        return cached
+
     if not OPENAI_AVAILABLE or not OPENAI_API_KEY:
         logger.warning("OpenAI not available, using fallback")
         return summarize_fallback(paper)
-    
-    # Initialize client with explicit parameters (avoid environment proxy issues)
-    try:
-        # Temporarily clear proxy environment variables that might interfere
-        # GitHub Actions sometimes sets these which cause issues with OpenAI client
-        old_http_proxy = os.environ.pop('HTTP_PROXY', None)
-        old_https_proxy = os.environ.pop('HTTPS_PROXY', None)
-        old_http_proxy_lower = os.environ.pop('http_proxy', None)
-        old_https_proxy_lower = os.environ.pop('https_proxy', None)
-        
-        try:
-            # Create client with only supported parameters
-            # Newer versions of openai library don't support 'proxies' parameter
-            client = OpenAI(
-                api_key=OPENAI_API_KEY,
-                timeout=30.0,  # Explicit timeout
-                max_retries=2   # Retry on transient failures
-            )
-            logger.debug(f"OpenAI client initialized with model: {OPENAI_MODEL}")
-        finally:
-            # Restore proxy environment variables
-            if old_http_proxy:
-                os.environ['HTTP_PROXY'] = old_http_proxy
-            if old_https_proxy:
-                os.environ['HTTPS_PROXY'] = old_https_proxy
-            if old_http_proxy_lower:
-                os.environ['http_proxy'] = old_http_proxy_lower
-            if old_https_proxy_lower:
-                os.environ['https_proxy'] = old_https_proxy_lower
-                
-    except TypeError as e:
-        # Handle version incompatibility - try minimal initialization
-        if "proxies" in str(e) or "unexpected keyword argument" in str(e):
-            logger.warning(f"OpenAI client initialization failed with TypeError (likely version issue), using minimal params: {e}")
-            try:
-                client = OpenAI(api_key=OPENAI_API_KEY)
-                logger.debug("OpenAI client initialized with minimal parameters")
-            except Exception as e2:
-                logger.error(f"Failed to initialize OpenAI client even with minimal params: {e2}")
-                return summarize_fallback(paper)
-        else:
-            logger.error(f"Failed to initialize OpenAI client: {e}")
-            return summarize_fallback(paper)
-    except Exception as e:
-        logger.error(f"Failed to initialize OpenAI client: {e}")
+
+    client = get_openai_client()
+    if client is None:
         return summarize_fallback(paper)
-    
+
     # Prepare paper context for LLM
     authors_str = ", ".join(paper.authors[:3])
     if len(paper.authors) > 3:
@@ -388,27 +660,42 @@ arXiv Link: https://arxiv.org/abs/{paper.arxiv_id}
 
 Generate engaging social media content highlighting the key innovations and SOTA contributions."""
     
-    logger.debug(f"Sending request to OpenAI - Model: {OPENAI_MODEL}")
+    logger.debug("Sending request to OpenAI - Model: %s", OPENAI_MODEL)
     
     try:
-        resp = client.chat.completions.create(
-            model=OPENAI_MODEL,
-            messages=[
-                {"role": "system", "content": RESEARCH_PROMPT},
-                {"role": "user", "content": user_msg},
-            ],
-            temperature=0.7,
-            max_tokens=1500,
-            response_format={"type": "json_object"}
-        )
-        
-        logger.debug(f"OpenAI API response received - Usage: {resp.usage}")
+        try:
+            resp = client.chat.completions.create(
+                model=OPENAI_MODEL,
+                messages=[
+                    {"role": "system", "content": RESEARCH_PROMPT},
+                    {"role": "user", "content": user_msg},
+                ],
+                temperature=0.7,
+                max_tokens=1500,
+                response_format=_SUMMARY_SCHEMA
+            )
+        except Exception as schema_err:
+            # Older/custom models may not support json_schema — retry once
+            # with the plain JSON-object mode before giving up entirely
+            logger.debug("Structured-output request failed (%s), retrying with json_object", schema_err)
+            resp = client.chat.completions.create(
+                model=OPENAI_MODEL,
+                messages=[
+                    {"role": "system", "content": RESEARCH_PROMPT},
+                    {"role": "user", "content": user_msg},
+                ],
+                temperature=0.7,
+                max_tokens=1500,
+                response_format={"type": "json_object"}
+            )
+
+        logger.debug("OpenAI API response received - Usage: %s", resp.usage)
         raw_response = (resp.choices[0].message.content or "").strip()
         
         # Parse JSON response
         try:
-            result = json.loads(raw_response)
-        except json.JSONDecodeError as e:
+            result = _json_loads(raw_response)
+        except ValueError as e:  # orjson.JSONDecodeError / json.JSONDecodeError
             logger.error(f"Failed to parse OpenAI JSON response: {e}")
             return summarize_fallback(paper)
         
@@ -421,19 +708,22 @@ Generate engaging social media content highlighting the key innovations and SOTA
             return summarize_fallback(paper)
         
         # Validate and truncate if needed
+        truncated = False
         if len(x_text) > MAX_X_CHARS:
             logger.warning(f"⚠️ X text exceeded limit ({len(x_text)} > {MAX_X_CHARS}), truncating...")
             x_text = x_text[:MAX_X_CHARS - 3] + "..."
-        
+            truncated = True
+
         if len(linkedin_text) > MAX_LINKEDIN_CHARS:
             logger.warning(f"⚠️ LinkedIn text exceeded limit ({len(linkedin_text)} > {MAX_LINKEDIN_CHARS}), truncating...")
             linkedin_text = linkedin_text[:MAX_LINKEDIN_CHARS - 3] + "..."
-        
+            truncated = True
+
         logger.info(f"✅ Generated dual-platform research summaries:")
         logger.info(f"   🐦 X: {len(x_text)}/{MAX_X_CHARS} chars")
         logger.info(f"   💼 LinkedIn: {len(linkedin_text)}/{MAX_LINKEDIN_CHARS} chars")
-        
-        return {
+
+        result = {
             "x_text": x_text,
             "linkedin_text": linkedin_text,
             "char_counts": {
@@ -441,11 +731,253 @@ Generate engaging social media content highlighting the key innovations and SOTA
                 "linkedin": len(linkedin_text)
             }
         }
+
+        # Cache clean responses only — a truncated one deserves a retry
+        # next run rather than being replayed forever
+        if not truncated:
+            _save_llm_cache(cache_path, result)
+
+        return result
     
     except Exception as e:
         logger.error(f"OpenAI API error: {type(e).__name__}: {e}")
         return summarize_fallback(paper)
 
+_BATCH_PROMPT_SUFFIX = """
+
+You will receive SEVERAL papers in one request. Summarize EACH paper
+independently, following all the rules above per paper. Output STRICTLY as
+valid JSON (no extra text, no markdown code blocks):
+{
+  "results": [
+    {"arxiv_id": "...", "x_text": "...", "linkedin_text": "...", "char_counts": {"x": 0, "linkedin": 0}}
+  ]
+}
+with exactly one entry per paper, in the same order as given."""
+
+def summarize_with_openai_batch(papers: List[ResearchPaper]) -> Dict[str, Dict[str, Any]]:
+    """
+    Summarize several papers in a single chat completion so the system
+    prompt is shipped (and billed) once for the whole batch.
+    Returns a map of arXiv ID to summaries. Papers missing from the
+    response — or the whole batch when the call fails — are simply absent;
+    the caller retries those through summarize_with_openai.
+    """
+    results: Dict[str, Dict[str, Any]] = {}
+
+    # Serve cached papers locally; only ship the rest to the API
+    pending: List[ResearchPaper] = []
+    for paper in papers:
+        cached = _load_llm_cache(_llm_cache_path(paper))
+        if cached is not None:
+            results[paper.arxiv_id] = cached
+        else:
+            pending.append(paper)
+
+    if not pending:
+        return results
+    if not OPENAI_AVAILABLE or not OPENAI_API_KEY:
+        return results
+    client = get_openai_client()
+    if client is None:
+        return results
+
+    blocks = []
+    for i, paper in enumerate(pending, 1):
+        authors_str = ", ".join(paper.authors[:3])
+        if len(paper.authors) > 3:
+            authors_str += f" et al. ({len(paper.authors)} authors)"
+        blocks.append(
+            f"Paper {i}:\n"
+            f"arXiv ID: {paper.arxiv_id}\n"
+            f"Title: {paper.title}\n"
+            f"Authors: {authors_str}\n"
+            f"Categories: {', '.join(paper.categories[:3])}\n"
+            f"Published: {paper.published.strftime('%Y-%m-%d')}\n\n"
+            f"Abstract:\n{paper.abstract}\n\n"
+            f"arXiv Link: https://arxiv.org/abs/{paper.arxiv_id}"
+        )
+
+    logger.debug("Sending batch of %d papers to OpenAI - Model: %s", len(pending), OPENAI_MODEL)
+
+    try:
+        resp = client.chat.completions.create(
+            model=OPENAI_MODEL,
+            messages=[
+                {"role": "system", "content": RESEARCH_PROMPT + _BATCH_PROMPT_SUFFIX},
+                {"role": "user", "content": "\n\n---\n\n".join(blocks)},
+            ],
+            temperature=0.7,
+            max_tokens=1500 * len(pending),
+            response_format={"type": "json_object"}
+        )
+        raw_response = (resp.choices[0].message.content or "").strip()
+        parsed = _json_loads(raw_response)
+    except Exception as e:
+        logger.warning(f"Batch summarization failed ({type(e).__name__}: {e}), falling back to per-paper calls")
+        return results
+
+    by_id = {p.arxiv_id: p for p in pending}
+    for entry in parsed.get("results", []):
+        arxiv_id = str(entry.get("arxiv_id", "")).strip()
+        paper = by_id.get(arxiv_id)
+        x_text = (entry.get("x_text") or "").strip()
+        linkedin_text = (entry.get("linkedin_text") or "").strip()
+        if paper is None or not x_text or not linkedin_text:
+            continue
+
+        truncated = False
+        if len(x_text) > MAX_X_CHARS:
+            x_text = x_text[:MAX_X_CHARS - 3] + "..."
+            truncated = True
+        if len(linkedin_text) > MAX_LINKEDIN_CHARS:
+            linkedin_text = linkedin_text[:MAX_LINKEDIN_CHARS - 3] + "..."
+            truncated = True
+
+        summary = {
+            "x_text": x_text,
+            "linkedin_text": linkedin_text,
+            "char_counts": {
+                "x": len(x_text),
+                "linkedin": len(linkedin_text)
+            }
+        }
+        if not truncated:
+            _save_llm_cache(_llm_cache_path(paper), summary)
+        results[arxiv_id] = summary
+
+    logger.info(f"✅ Batch summarized {len(results)}/{len(papers)} papers in one call")
+    return results
+
+def summarize_via_batch_api(papers: List[ResearchPaper]) -> Dict[str, Dict[str, Any]]:
+    """
+    Summarize papers through OpenAI's Batch API (~50% cheaper per token).
+    Opt-in via OPENAI_BATCH_MODE=1 — completion usually lands in minutes but
+    the SLA is 24h, so this only suits runs that aren't latency-bound.
+    Returns a map of arXiv ID to summaries; missing IDs fall back to the
+    synchronous path in the caller, same contract as summarize_with_openai_batch.
+    """
+    results: Dict[str, Dict[str, Any]] = {}
+
+    pending: List[ResearchPaper] = []
+    for paper in papers:
+        cached = _load_llm_cache(_llm_cache_path(paper))
+        if cached is not None:
+            results[paper.arxiv_id] = cached
+        else:
+            pending.append(paper)
+
+    if not pending:
+        return results
+    if not OPENAI_AVAILABLE or not OPENAI_API_KEY:
+        return results
+    client = get_openai_client()
+    if client is None:
+        return results
+
+    lines = []
+    for paper in pending:
+        authors_str = ", ".join(paper.authors[:3])
+        if len(paper.authors) > 3:
+            authors_str += f" et al. ({len(paper.authors)} authors)"
+        user_msg = (
+            f"Research Paper Details:\n\n"
+            f"Title: {paper.title}\n"
+            f"Authors: {authors_str}\n"
+            f"arXiv ID: {paper.arxiv_id}\n"
+            f"Categories: {', '.join(paper.categories[:3])}\n"
+            f"Published: {paper.published.strftime('%Y-%m-%d')}\n\n"
+            f"Abstract:\n{paper.abstract}\n\n"
+            f"arXiv Link: https://arxiv.org/abs/{paper.arxiv_id}\n\n"
+            f"Generate engaging social media content highlighting the key innovations and SOTA contributions."
+        )
+        lines.append(_json_dumps({
+            "custom_id": paper.arxiv_id,
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": {
+                "model": OPENAI_MODEL,
+                "messages": [
+                    {"role": "system", "content": RESEARCH_PROMPT},
+                    {"role": "user", "content": user_msg},
+                ],
+                "temperature": 0.7,
+                "max_tokens": 1500,
+                "response_format": {"type": "json_object"}
+            }
+        }))
+
+    try:
+        batch_input = client.files.create(
+            file=("summaries_batch.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch"
+        )
+        batch = client.batches.create(
+            input_file_id=batch_input.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        logger.info(f"📦 Submitted OpenAI batch {batch.id} with {len(pending)} papers...")
+
+        deadline = time.monotonic() + OPENAI_BATCH_TIMEOUT_SECONDS
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            if time.monotonic() > deadline:
+                logger.warning(f"⚠️ OpenAI batch {batch.id} still {batch.status} after timeout, falling back")
+                return results
+            time.sleep(OPENAI_BATCH_POLL_SECONDS)
+            batch = client.batches.retrieve(batch.id)
+
+        if batch.status != "completed" or not batch.output_file_id:
+            logger.warning(f"⚠️ OpenAI batch {batch.id} ended with status '{batch.status}', falling back")
+            return results
+
+        output = client.files.content(batch.output_file_id)
+    except Exception as e:
+        logger.warning(f"Batch API submission failed ({type(e).__name__}: {e}), falling back to sync calls")
+        return results
+
+    by_id = {p.arxiv_id: p for p in pending}
+    for line in output.text.splitlines():
+        if not line.strip():
+            continue
+        try:
+            entry = _json_loads(line)
+            arxiv_id = entry.get("custom_id", "")
+            body = entry["response"]["body"]
+            raw = (body["choices"][0]["message"]["content"] or "").strip()
+            parsed = _json_loads(raw)
+        except (ValueError, KeyError, IndexError, TypeError):
+            continue
+
+        paper = by_id.get(arxiv_id)
+        x_text = (parsed.get("x_text") or "").strip()
+        linkedin_text = (parsed.get("linkedin_text") or "").strip()
+        if paper is None or not x_text or not linkedin_text:
+            continue
+
+        truncated = False
+        if len(x_text) > MAX_X_CHARS:
+            x_text = x_text[:MAX_X_CHARS - 3] + "..."
+            truncated = True
+        if len(linkedin_text) > MAX_LINKEDIN_CHARS:
+            linkedin_text = linkedin_text[:MAX_LINKEDIN_CHARS - 3] + "..."
+            truncated = True
+
+        summary = {
+            "x_text": x_text,
+            "linkedin_text": linkedin_text,
+            "char_counts": {
+                "x": len(x_text),
+                "linkedin": len(linkedin_text)
+            }
+        }
+        if not truncated:
+            _save_llm_cache(_llm_cache_path(paper), summary)
+        results[arxiv_id] = summary
+
+    logger.info(f"✅ Batch API returned {len(results)}/{len(papers)} summaries")
+    return results
+
 # ==============================
 # FALLBACK SUMMARIZATION
 # ==============================
@@ -478,8 +1010,16 @@ def summarize_fallback(paper: ResearchPaper) -> Dict[str, Any]:
     authors_list = ", ".join(paper.authors[:3])
     if len(paper.authors) > 3:
         authors_list += f" et al."
-    
-    linkedin_text = f"""New Breakthrough in AI Research
+
+    # Strip the abstract once and slice the bounded excerpts up front
+    # instead of re-stripping fresh copies inside the f-string
+    abstract_s = paper.abstract.strip()
+    key_excerpt = abstract_s[:200].rstrip()
+
+    # Compose head and tail first so the abstract-summary excerpt can be
+    # sized to the remaining budget — the result fits MAX_LINKEDIN_CHARS by
+    # construction instead of being built full-length and truncated after
+    linkedin_head = f"""New Breakthrough in AI Research
 
 {paper.title}
 
@@ -487,14 +1027,15 @@ Authors: {authors_list}
 arXiv: {paper.arxiv_id} | Submitted: {paper.published.strftime('%B %d, %Y')}
 
 Key Innovation:
-→ {paper.abstract[:200].strip()}...
+→ {key_excerpt}...
 
 Method:
 • Novel approach in {paper.primary_category.replace('cs.', '')} research
 • Published in {', '.join(paper.categories[:2])}
 
 Abstract Summary:
-{paper.abstract[:600].strip()}{'...' if len(paper.abstract) > 600 else ''}
+"""
+    linkedin_tail = f"""
 
 Why it matters for Algorythmos:
 This research could inform next-generation AI automation workflows and MLOps practices.
@@ -504,7 +1045,17 @@ Read the full paper: https://arxiv.org/abs/{paper.arxiv_id}
 What are your thoughts on this approach? Ready for production?
 
 #AI #MachineLearning #DeepLearning #Research #MLOps"""
-    
+
+    # Reserve 3 chars for a possible ellipsis so the join below can't overflow
+    abstract_budget = max(MAX_LINKEDIN_CHARS - len(linkedin_head) - len(linkedin_tail) - 3, 0)
+    summary_limit = min(600, abstract_budget)
+    summary_excerpt = abstract_s[:summary_limit].rstrip()
+    summary_ellipsis = '...' if len(abstract_s) > summary_limit else ''
+
+    linkedin_text = "".join((linkedin_head, summary_excerpt, summary_ellipsis, linkedin_tail))
+
+    # Belt-and-braces only — unreachable unless a pathological title alone
+    # blows the budget
     if len(linkedin_text) > MAX_LINKEDIN_CHARS:
         linkedin_text = linkedin_text[:MAX_LINKEDIN_CHARS - 3] + "..."
     
@@ -523,11 +1074,18 @@ What are your thoughts on this approach? Ready for production?
 # NOTION INTEGRATION
 # ==============================
 
+# Shared Notion client so schema check, history query and row creation all
+# reuse one connection pool instead of re-handshaking TLS per call
+_NOTION_CLIENT: Optional[Client] = None
+
 def get_notion_client() -> Client:
     """Create or return cached Notion client."""
-    if not NOTION_TOKEN:
-        raise RuntimeError("NOTION_TOKEN must be set")
-    return Client(auth=NOTION_TOKEN)
+    global _NOTION_CLIENT
+    if _NOTION_CLIENT is None:
+        if not NOTION_TOKEN:
+            raise RuntimeError("NOTION_TOKEN must be set")
+        _NOTION_CLIENT = Client(auth=NOTION_TOKEN)
+    return _NOTION_CLIENT
 
 def ensure_notion_schema():
     """
@@ -592,46 +1150,192 @@ def ensure_notion_schema():
         logger.warning("Continuing with existing schema (may cause errors if properties missing)")
         # Continue — system may still work if some props exist
 
-def get_recent_notion_content(client: Client, db_id: str, days: int = 7) -> Set[Tuple[str, str]]:
+# In-process memo so duplicate history lookups reuse the first Notion fetch.
+# Entries expire after a short TTL so a long-lived interpreter (REPL, tests,
+# future daemon mode) eventually sees new rows; a normal cron run never
+# lives long enough to notice
+NOTION_HISTORY_TTL_SECONDS = int(os.getenv("NOTION_HISTORY_TTL_SECONDS", "300"))
+_recent_content_cache: Dict[Tuple[str, int], Tuple[float, Set[str]]] = {}
+
+def _open_notion_cache() -> sqlite3.Connection:
+    """Open (and initialize) the local SQLite mirror of the Notion history."""
+    conn = sqlite3.connect(NOTION_CACHE_DB)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("CREATE TABLE IF NOT EXISTS seen (arxiv_id TEXT PRIMARY KEY, seen_at INTEGER)")
+    conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+    return conn
+
+def _page_arxiv_id(page: Dict[str, Any]) -> str:
+    """Pull the arXiv ID rich-text value out of a Notion page."""
+    arxiv_prop = page.get("properties", {}).get("arXiv ID", {}).get("rich_text", [])
+    return arxiv_prop[0].get("text", {}).get("content", "") if arxiv_prop else ""
+
+def _notion_history_incremental(client: Client, db_id: str, days: int) -> Optional[Set[str]]:
+    """
+    Serve the duplicate set from the local SQLite mirror, asking Notion only
+    for pages edited since the last sync (usually zero on a daily cron).
+    Returns None when the mirror cannot serve (first run or any error), in
+    which case the caller falls back to the full scan and reseeds it.
+    """
+    try:
+        conn = _open_notion_cache()
+    except Exception as e:
+        logger.warning(f"Could not open Notion history cache: {e}")
+        return None
+
+    try:
+        row = conn.execute("SELECT value FROM meta WHERE key = 'last_sync'").fetchone()
+        if row is None:
+            return None  # never seeded — do a full scan first
+
+        now = datetime.now(timezone.utc)
+        now_epoch = int(now.timestamp())
+        query_kwargs: Dict[str, Any] = {
+            "database_id": db_id,
+            "filter": {
+                "timestamp": "last_edited_time",
+                "last_edited_time": {"on_or_after": row[0]},
+            },
+            "page_size": 100,
+        }
+
+        synced = 0
+        cursor: Optional[str] = None
+        while True:
+            if cursor:
+                query_kwargs["start_cursor"] = cursor
+            response = client.databases.query(**query_kwargs)
+            for page in response.get("results", []):
+                arxiv_id = _page_arxiv_id(page)
+                if arxiv_id:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO seen (arxiv_id, seen_at) VALUES (?, ?)",
+                        (arxiv_id, now_epoch),
+                    )
+                    synced += 1
+            cursor = response.get("next_cursor")
+            if not response.get("has_more") or not cursor:
+                break
+
+        conn.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES ('last_sync', ?)",
+            (now.replace(microsecond=0).isoformat().replace('+00:00', 'Z'),),
+        )
+        conn.commit()
+
+        cutoff_epoch = int((now - timedelta(days=days)).timestamp())
+        seen = {r[0] for r in conn.execute("SELECT arxiv_id FROM seen WHERE seen_at >= ?", (cutoff_epoch,))}
+        logger.info(f"📇 Notion history from local cache: {len(seen)} ids ({synced} rows synced)")
+        return seen
+    except Exception as e:
+        logger.warning(f"Notion incremental history sync failed, falling back to full scan: {e}")
+        return None
+    finally:
+        conn.close()
+
+def _seed_notion_cache(seen: Set[str], synced_at: datetime) -> None:
+    """Reseed the SQLite mirror after a successful full scan."""
+    try:
+        conn = _open_notion_cache()
+        with conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO seen (arxiv_id, seen_at) VALUES (?, ?)",
+                [(arxiv_id, int(synced_at.timestamp())) for arxiv_id in seen],
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('last_sync', ?)",
+                (synced_at.replace(microsecond=0).isoformat().replace('+00:00', 'Z'),),
+            )
+        conn.close()
+    except Exception as e:
+        logger.warning(f"Could not seed Notion history cache: {e}")
+
+def get_recent_notion_content(client: Client, db_id: str, days: int = 7) -> Set[str]:
     """
     Query Notion for recent entries to prevent duplicates.
-    Returns set of (normalized_title, arxiv_id) tuples.
+    Returns set of arXiv IDs (dedup is by exact ID; titles are not used).
+    Results are memoized per (db_id, days) for NOTION_HISTORY_TTL_SECONDS,
+    and mirrored to SQLite so later runs only sync pages edited since the
+    last run instead of re-paginating the whole window.
     """
+    cache_key = (db_id, days)
+    memo = _recent_content_cache.get(cache_key)
+    if memo is not None and time.monotonic() - memo[0] < NOTION_HISTORY_TTL_SECONDS:
+        logger.debug("Reusing cached Notion history for db %s... (last %d days)", db_id[:8], days)
+        return memo[1]
+
+    seen = _notion_history_incremental(client, db_id, days)
+    if seen is not None:
+        _recent_content_cache[cache_key] = (time.monotonic(), seen)
+        return seen
+
     try:
-        cutoff = datetime.now(timezone.utc) - timedelta(days=days)
+        sync_started = datetime.now(timezone.utc)
+        cutoff = sync_started - timedelta(days=days)
         cutoff_iso = cutoff.replace(microsecond=0).isoformat().replace('+00:00', 'Z')
-        
-        response = client.databases.query(
-            database_id=db_id,
-            filter={
-                "or": [
-                    {"property": "Status", "select": {"equals": "Scheduled"}},
-                    {"property": "Status", "select": {"equals": "Posted"}},
-                    {"property": "Status", "select": {"equals": "Failed"}},
+
+        query_kwargs: Dict[str, Any] = {
+            "database_id": db_id,
+            "filter": {
+                "and": [
+                    {
+                        "or": [
+                            {"property": "Status", "select": {"equals": "Scheduled"}},
+                            {"property": "Status", "select": {"equals": "Posted"}},
+                            {"property": "Status", "select": {"equals": "Failed"}},
+                        ]
+                    },
+                    # Server-side recency cut so old rows never leave Notion
+                    {"property": "Scheduled Time", "date": {"on_or_after": cutoff_iso}},
                 ]
-            }
-        )
-        
+            },
+            "sorts": [{"property": "Scheduled Time", "direction": "descending"}],
+            "page_size": 100,
+        }
+
+        # Optionally trim the response payload to just the properties we read.
+        # Notion wants property IDs here (not names), so they come from env.
+        filter_props = os.getenv("NOTION_HISTORY_FILTER_PROPS")
+        if filter_props:
+            query_kwargs["filter_properties"] = [p.strip() for p in filter_props.split(",") if p.strip()]
+
         seen = set()
-        for page in response.get("results", []):
-            props = page.get("properties", {})
-            
-            # Get title
-            title_prop = props.get("Title", {}).get("title", [])
-            title = title_prop[0].get("text", {}).get("content", "") if title_prop else ""
-            
-            # Get arXiv ID
-            arxiv_prop = props.get("arXiv ID", {}).get("rich_text", [])
-            arxiv_id = arxiv_prop[0].get("text", {}).get("content", "") if arxiv_prop else ""
-            
-            if title or arxiv_id:
-                normalized_title = title.lower().strip()
-                seen.add((normalized_title, arxiv_id))
-        
+        cursor: Optional[str] = None
+        while True:
+            if cursor:
+                query_kwargs["start_cursor"] = cursor
+            response = client.databases.query(**query_kwargs)
+
+            past_cutoff = False
+            for page in response.get("results", []):
+                arxiv_id = _page_arxiv_id(page)
+                if arxiv_id:
+                    seen.add(arxiv_id)
+
+                # Rows are sorted newest-first; once one falls past the
+                # cutoff every later row does too, so stop paginating
+                sched = (page.get("properties", {}).get("Scheduled Time", {}).get("date") or {}).get("start")
+                if sched:
+                    try:
+                        sched_dt = datetime.fromisoformat(sched.replace("Z", "+00:00"))
+                        if sched_dt < cutoff:
+                            past_cutoff = True
+                    except ValueError:
+                        pass
+
+            cursor = response.get("next_cursor")
+            if past_cutoff or not response.get("has_more") or not cursor:
+                break
+
         logger.info(f"Found {len(seen)} recent entries in Notion (last {days} days)")
+        _seed_notion_cache(seen, sync_started)
+        _recent_content_cache[cache_key] = (time.monotonic(), seen)
         return seen
-    
+
     except Exception as e:
+        # Don't cache failures — a later call should retry the fetch
         logger.warning(f"Could not fetch Notion history: {e}")
         return set()
 
@@ -642,11 +1346,19 @@ def notion_create_row(paper: ResearchPaper, summaries: Dict[str, Any]) -> Dict[s
     
     client = get_notion_client()
     scheduled_time = datetime.now(timezone.utc) - timedelta(minutes=5)
-    
+
+    # Status can be set correctly in the create call itself: a past
+    # scheduled time means the row is immediately publishable, so flipping
+    # it in a follow-up update was an unconditional extra round-trip
+    if datetime.now(timezone.utc) >= scheduled_time:
+        initial_status = "Ready to Post"
+    else:
+        initial_status = "Scheduled"
+
     properties = {
         "Title": {"title": [{"type": "text", "text": {"content": paper.title}}]},
         "Scheduled Time": {"date": {"start": scheduled_time.replace(microsecond=0).isoformat().replace('+00:00', 'Z')}},
-        "Status": {"select": {"name": "Scheduled"}},
+        "Status": {"select": {"name": initial_status}},
         "arXiv ID": {"rich_text": [{"text": {"content": paper.arxiv_id}}]},
         "arXiv Link": {"url": f"https://arxiv.org/abs/{paper.arxiv_id}"},
         "Authors": {"rich_text": [{"text": {"content": ", ".join(paper.authors[:5])}}]},
@@ -662,23 +1374,7 @@ def notion_create_row(paper: ResearchPaper, summaries: Dict[str, Any]) -> Dict[s
             parent={"database_id": NOTION_DB_ID},
             properties=properties
         )
-        page_id = response["id"]
-        logger.info(f"✅ Created Notion entry for paper: {paper.arxiv_id}")
-        
-        # Auto-set to "Ready to Post" for immediate publishing
-        # Only set to "Ready" if scheduled time has passed (immediate posting)
-        current_time = datetime.now(timezone.utc)
-        if current_time >= scheduled_time:
-            try:
-                client.pages.update(
-                    page_id=page_id,
-                    properties={"Status": {"select": {"name": "Ready to Post"}}}
-                )
-                logger.info(f"✅ Auto-set page {page_id[:8]}... to 'Ready to Post' for immediate publishing")
-            except Exception as e:
-                logger.warning(f"⚠️ Failed to auto-set status to Ready: {e}")
-                logger.info(f"Entry remains as 'Scheduled' - will need manual update or time-based trigger")
-        
+        logger.info(f"✅ Created Notion entry for paper: {paper.arxiv_id} (status: {initial_status})")
         return response
     except Exception as e:
         logger.error(f"❌ Failed to create Notion entry: {e}")
@@ -688,38 +1384,123 @@ def notion_create_row(paper: ResearchPaper, summaries: Dict[str, Any]) -> Dict[s
 # MAIN WORKFLOW
 # ==============================
 
+def _journal_pending_write(paper: ResearchPaper, summaries: Dict[str, Any]) -> None:
+    """
+    Record an outgoing Notion write before it is sent, so a crash between
+    summarization and the Notion ACK leaves a replayable record instead of
+    silently losing the generated post.
+    """
+    try:
+        entry = _json_dumps({
+            "arxiv_id": paper.arxiv_id,
+            "paper": paper.to_cache_dict(),
+            "summaries": summaries,
+            "queued_at": datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace('+00:00', 'Z'),
+        })
+        existing = ""
+        if os.path.exists(PENDING_WRITES_PATH):
+            with open(PENDING_WRITES_PATH, encoding="utf-8") as f:
+                existing = f.read()
+        tmp_path = PENDING_WRITES_PATH + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(existing + entry + "\n")
+        os.replace(tmp_path, PENDING_WRITES_PATH)
+    except Exception as e:
+        logger.warning(f"Could not journal pending Notion write: {e}")
+
+def _clear_pending_write(arxiv_id: str) -> None:
+    """Drop an acknowledged write from the journal (remove file when empty)."""
+    try:
+        if not os.path.exists(PENDING_WRITES_PATH):
+            return
+        with open(PENDING_WRITES_PATH, encoding="utf-8") as f:
+            lines = [ln for ln in f.read().splitlines() if ln.strip()]
+        remaining = [ln for ln in lines if _json_loads(ln).get("arxiv_id") != arxiv_id]
+        if not remaining:
+            os.remove(PENDING_WRITES_PATH)
+            return
+        tmp_path = PENDING_WRITES_PATH + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write("\n".join(remaining) + "\n")
+        os.replace(tmp_path, PENDING_WRITES_PATH)
+    except Exception as e:
+        logger.warning(f"Could not clear pending-write journal entry: {e}")
+
+def _summary_quality(paper: ResearchPaper, summaries: Dict[str, Any]) -> Tuple[bool, bool, float]:
+    """
+    Rank a candidate post for --topk selection.
+    Prefers summaries that fit both platform limits untruncated, then ones
+    carrying hashtags, then the higher-scored paper as the tiebreaker.
+    """
+    x_text = summaries.get("x_text", "")
+    linkedin_text = summaries.get("linkedin_text", "")
+    fits_limits = (
+        0 < len(x_text) <= MAX_X_CHARS
+        and 0 < len(linkedin_text) <= MAX_LINKEDIN_CHARS
+        and not x_text.endswith("...")
+    )
+    has_hashtags = "#" in x_text and "#" in linkedin_text
+    return (fits_limits, has_hashtags, paper.score)
+
 def main():
     """Main execution workflow."""
     parser = argparse.ArgumentParser(description="Algorythmos AI Research Digest v3.0")
     parser.add_argument("--dry-run", action="store_true", help="Print summary without writing to Notion")
+    parser.add_argument("--topk", type=int, default=1,
+                        help="Summarize the top K scored papers concurrently and post the best one (default: 1)")
     args = parser.parse_args()
     
     logger.info("=== Algorythmos AI Research Digest v3.0 ===")
     logger.info(f"Dry run mode: {args.dry_run}")
     logger.info(f"arXiv categories: {', '.join(ARXIV_CATEGORIES)}")
     
-    # Ensure Notion database schema is up-to-date (self-healing)
-    if NOTION_TOKEN and NOTION_DB_ID and not args.dry_run:
-        ensure_notion_schema()
-    
     try:
-        # 1. Fetch recent arXiv papers
-        papers = fetch_arxiv_papers()
-        
+        # 1+2. The arXiv fetch, Notion schema check and duplicate-history
+        # query hit independent services — run them concurrently so this
+        # I/O-bound stage costs max() of the three instead of their sum
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            papers_future = executor.submit(fetch_arxiv_papers)
+
+            schema_future = None
+            history_future = None
+            if NOTION_TOKEN and NOTION_DB_ID:
+                if not args.dry_run:
+                    # Ensure Notion database schema is up-to-date (self-healing)
+                    schema_future = executor.submit(ensure_notion_schema)
+                history_future = executor.submit(
+                    get_recent_notion_content, get_notion_client(), NOTION_DB_ID, 7
+                )
+
+            papers = papers_future.result()
+
+            if schema_future is not None:
+                # ensure_notion_schema logs and degrades gracefully on its own
+                schema_future.result()
+
+            notion_recent = set()
+            if history_future is not None:
+                try:
+                    notion_recent = history_future.result()
+                    logger.info(f"📚 Found {len(notion_recent)} recent entries in Notion for duplicate checking")
+                except Exception as e:
+                    logger.warning(f"Could not fetch Notion history for scoring: {e}")
+
         if not papers:
             logger.warning("No papers found from arXiv")
             return 0
-        
-        # 2. Get recent Notion content for duplicate detection
-        notion_recent = set()
-        if NOTION_TOKEN and NOTION_DB_ID:
-            try:
-                client = get_notion_client()
-                notion_recent = get_recent_notion_content(client, NOTION_DB_ID, days=7)
-                logger.info(f"📚 Found {len(notion_recent)} recent entries in Notion for duplicate checking")
-            except Exception as e:
-                logger.warning(f"Could not fetch Notion history for scoring: {e}")
-        
+
+        # 2b. Drop already-posted papers before any scoring or LLM work —
+        # otherwise yesterday's winner is scored, possibly summarized, and
+        # only then buried by the duplicate penalty
+        if notion_recent:
+            fetched = len(papers)
+            papers = [p for p in papers if p.arxiv_id not in notion_recent]
+            if fetched != len(papers):
+                logger.info(f"🚫 Skipped {fetched - len(papers)} papers already tracked in Notion")
+            if not papers:
+                logger.warning("All fetched papers are already in Notion")
+                return 0
+
         # 3. Score papers with enhanced impact filters
         scored_papers = score_papers(papers, notion_recent=notion_recent)
         
@@ -727,16 +1508,36 @@ def main():
             logger.warning("No papers passed scoring filters")
             return 0
         
-        # 4. Pick top paper
-        top_paper = scored_papers[0]
+        # 4+5. Pick top paper(s) and generate professional summaries.
+        # With --topk > 1 the top candidates go out as one batched LLM call
+        # (system prompt billed once); any candidate the batch misses falls
+        # back to concurrent per-paper calls, and the best post wins
+        candidates = scored_papers[:max(1, args.topk)]
+        if len(candidates) > 1:
+            logger.info(f"🧪 Summarizing top {len(candidates)} candidates for best-post selection...")
+            if OPENAI_BATCH_MODE:
+                batch_results = summarize_via_batch_api(candidates)
+            else:
+                batch_results = summarize_with_openai_batch(candidates)
+            missing = [p for p in candidates if p.arxiv_id not in batch_results]
+            if missing:
+                with ThreadPoolExecutor(max_workers=len(missing)) as executor:
+                    for paper, summary in zip(missing, executor.map(summarize_with_openai, missing)):
+                        batch_results[paper.arxiv_id] = summary
+            candidate_summaries = [batch_results[p.arxiv_id] for p in candidates]
+            top_paper, summaries = max(
+                zip(candidates, candidate_summaries),
+                key=lambda pair: _summary_quality(pair[0], pair[1]),
+            )
+        else:
+            top_paper = candidates[0]
+            summaries = summarize_with_openai(top_paper)
+
         logger.info(f"🏆 Selected top paper (score={top_paper.score:.1f}):")
         logger.info(f"   📄 Title: {top_paper.title}")
         logger.info(f"   🔬 arXiv: {top_paper.arxiv_id}")
         logger.info(f"   👥 Authors: {', '.join(top_paper.authors[:3])}")
         logger.info(f"   📚 Category: {top_paper.primary_category}")
-        
-        # 5. Generate professional summaries
-        summaries = summarize_with_openai(top_paper)
         logger.info(f"📝 Generated professional platform-specific summaries:")
         logger.info(f"   🐦 X: {summaries['char_counts']['x']}/{MAX_X_CHARS} chars")
         logger.info(f"   💼 LinkedIn: {summaries['char_counts']['linkedin']}/{MAX_LINKEDIN_CHARS} chars")
@@ -750,12 +1551,23 @@ def main():
                 "paper": top_paper.to_dict(),
                 "note": "🧪 DRY RUN: Notion write skipped"
             }
-            print(json.dumps(output, ensure_ascii=False, indent=2))
+            print(_json_dumps(output, indent=True))
             return 0
         
-        # 7. Create Notion entry
-        notion_create_row(top_paper, summaries)
-        logger.info("=== Algorythmos AI Research Digest Completed Successfully ===")
+        # 7. Create Notion entry off the critical path: journal it locally
+        # first, hand the round-trip to a background worker, and only join
+        # at the very end of the run
+        _journal_pending_write(top_paper, summaries)
+        with ThreadPoolExecutor(max_workers=1) as writer:
+            write_future = writer.submit(notion_create_row, top_paper, summaries)
+            logger.info("=== Algorythmos AI Research Digest Completed Successfully ===")
+
+        try:
+            write_future.result()
+        except Exception:
+            logger.error(f"❌ Notion write failed; entry kept in {PENDING_WRITES_PATH} for replay")
+            raise
+        _clear_pending_write(top_paper.arxiv_id)
         logger.info(f"✅ Scheduled paper {top_paper.arxiv_id} for posting")
         return 0
     
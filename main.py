@@ -43,16 +43,20 @@ logging.basicConfig(
     datefmt="%Y-%m-%d %H:%M:%S"
 )
 logger = logging.getLogger(__name__)
-logger.debug(f"Logging initialized at level: {log_level}")
+logger.debug("Logging initialized at level: %s", log_level)
 
 # ----- Clients -----
 try:
     notion = Client(auth=NOTION_TOKEN)
     logger.debug("Notion client initialized successfully")
 except Exception as e:
-    logger.error(f"Failed to initialize Notion client: {e}", exc_info=True)
+    logger.error("Failed to initialize Notion client: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
     raise
 
+# Shared HTTP session so LinkedIn API calls and media downloads reuse
+# pooled keep-alive connections instead of a fresh TLS handshake each time
+http_session = requests.Session()
+
 # ----- Helpers -----
 def iso(dt_obj: datetime) -> str:
     """Convert datetime to ISO 8601 string with 'Z' suffix (UTC)."""
@@ -174,8 +178,8 @@ def verify_x_post(tweet_id: str) -> Dict[str, Any]:
         )
         
         if tweet.data:
-            logger.debug(f"✅ Tweet {tweet_id} is visible")
-            logger.debug(f"Tweet data: {tweet.data}")
+            logger.debug("✅ Tweet %s is visible", tweet_id)
+            logger.debug("Tweet data: %s", tweet.data)
             return {
                 "visible": True,
                 "status": "PUBLISHED",
@@ -198,7 +202,7 @@ def verify_x_post(tweet_id: str) -> Dict[str, Any]:
             "error": "Tweet not found (deleted or hidden)"
         }
     except Exception as e:
-        logger.error(f"Error verifying tweet {tweet_id}: {e}", exc_info=True)
+        logger.error("Error verifying tweet %s: %s", tweet_id, e, exc_info=logger.isEnabledFor(logging.DEBUG))
         return {
             "visible": False,
             "status": "ERROR",
@@ -222,23 +226,23 @@ def verify_linkedin_post(post_urn: str, max_retries: int = 3) -> Dict[str, Any]:
     for attempt in range(max_retries):
         try:
             # Query post details
-            response = requests.get(
+            response = http_session.get(
                 f"https://api.linkedin.com/v2/ugcPosts/{post_urn}",
                 headers=headers,
                 timeout=10
             )
             
-            logger.debug(f"LinkedIn verify attempt {attempt + 1}/{max_retries}: status {response.status_code}")
+            logger.debug("LinkedIn verify attempt %d/%d: status %s", attempt + 1, max_retries, response.status_code)
             
             if response.status_code == 200:
                 data = response.json()
                 lifecycle_state = data.get("lifecycleState", "UNKNOWN")
                 visibility = data.get("visibility", {})
                 
-                logger.debug(f"LinkedIn post {post_urn}: lifecycleState={lifecycle_state}, visibility={visibility}")
+                logger.debug("LinkedIn post %s: lifecycleState=%s, visibility=%s", post_urn, lifecycle_state, visibility)
                 
                 if lifecycle_state == "PUBLISHED":
-                    logger.debug(f"✅ LinkedIn post {post_urn} is published")
+                    logger.debug("✅ LinkedIn post %s is published", post_urn)
                     return {
                         "visible": True,
                         "status": "PUBLISHED",
@@ -280,7 +284,7 @@ def verify_linkedin_post(post_urn: str, max_retries: int = 3) -> Dict[str, Any]:
                 }
         
         except Exception as e:
-            logger.error(f"Error verifying LinkedIn post {post_urn}: {e}", exc_info=True)
+            logger.error("Error verifying LinkedIn post %s: %s", post_urn, e, exc_info=logger.isEnabledFor(logging.DEBUG))
             if attempt < max_retries - 1:
                 time.sleep(60)
                 continue
@@ -301,7 +305,7 @@ def post_to_x(text: str, media_urls: List[str] = None) -> str:
     """
     Post to X (Twitter) and return the tweet URL.
     """
-    logger.debug(f"post_to_x() called - Text length: {len(text)}, Media URLs: {len(media_urls) if media_urls else 0}")
+    logger.debug("post_to_x() called - Text length: %d, Media URLs: %d", len(text), len(media_urls) if media_urls else 0)
     
     if not all([X_API_KEY, X_API_SECRET, X_ACCESS_TOKEN, X_ACCESS_TOKEN_SECRET]):
         logger.error("Missing X API credentials")
@@ -319,7 +323,7 @@ def post_to_x(text: str, media_urls: List[str] = None) -> str:
         )
         logger.debug("Tweepy client created successfully")
     except Exception as e:
-        logger.error(f"Failed to create Tweepy client: {e}", exc_info=True)
+        logger.error("Failed to create Tweepy client: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
         raise
     
     media_ids = []
@@ -335,27 +339,27 @@ def post_to_x(text: str, media_urls: List[str] = None) -> str:
         
         for i, media_url in enumerate(media_urls[:4], 1):  # Twitter allows max 4 images
             try:
-                logger.debug(f"Downloading media {i}/{len(media_urls[:4])} from {media_url}")
-                response = requests.get(media_url, timeout=10)
+                logger.debug("Downloading media %d/%d from %s", i, len(media_urls[:4]), media_url)
+                response = http_session.get(media_url, timeout=10)
                 response.raise_for_status()
-                logger.debug(f"Downloaded {len(response.content)} bytes")
+                logger.debug("Downloaded %d bytes", len(response.content))
                 
                 # Upload to Twitter
-                logger.debug(f"Uploading media to X API")
+                logger.debug("Uploading media to X API")
                 media = api.media_upload(filename="temp.jpg", file=io.BytesIO(response.content))
                 media_ids.append(media.media_id)
                 logger.info(f"✅ Uploaded media {i}: ID {media.media_id}")
             except Exception as e:
-                logger.warning(f"⚠️ Failed to upload media {media_url}: {type(e).__name__}: {e}", exc_info=True)
+                logger.warning("⚠️ Failed to upload media %s: %s: %s", media_url, type(e).__name__, e, exc_info=logger.isEnabledFor(logging.DEBUG))
     
     # Post tweet
     logger.info(f"🐦 Posting tweet to X (text length: {len(text)}, media count: {len(media_ids)})")
-    logger.debug(f"Tweet text: {text}")
+    logger.debug("Tweet text: %s", text)
     
     try:
         response = client.create_tweet(text=text, media_ids=media_ids if media_ids else None)
         tweet_id = response.data['id']
-        logger.debug(f"X API response: {response}")
+        logger.debug("X API response: %s", response)
         
         # Get username for URL (use a default or fetch from API)
         # For simplicity, we'll construct URL with generic path
@@ -384,7 +388,7 @@ def post_to_x(text: str, media_urls: List[str] = None) -> str:
         
         return tweet_url
     except Exception as e:
-        logger.error(f"❌ Failed to post to X: {type(e).__name__}: {e}", exc_info=True)
+        logger.error("❌ Failed to post to X: %s: %s", type(e).__name__, e, exc_info=logger.isEnabledFor(logging.DEBUG))
         raise
 
 # ----- LinkedIn Posting -----
@@ -393,7 +397,7 @@ def post_to_linkedin(text: str, media_urls: List[str] = None) -> str:
     Post to LinkedIn and return the post URL.
     Supports both user posts and organization posts.
     """
-    logger.debug(f"post_to_linkedin() called - Text length: {len(text)}, Media URLs: {len(media_urls) if media_urls else 0}")
+    logger.debug("post_to_linkedin() called - Text length: %d, Media URLs: %d", len(text), len(media_urls) if media_urls else 0)
     
     if not LINKEDIN_ACCESS_TOKEN:
         logger.error("Missing LinkedIn access token")
@@ -410,31 +414,32 @@ def post_to_linkedin(text: str, media_urls: List[str] = None) -> str:
     # Determine author (organization or user)
     if LINKEDIN_ORG_ID:
         author = f"urn:li:organization:{LINKEDIN_ORG_ID}"
-        logger.debug(f"Using organization author: {author}")
+        logger.debug("Using organization author: %s", author)
     else:
         # Get user's profile to get their URN
         logger.debug("Fetching LinkedIn user profile to get author URN")
         try:
-            profile_response = requests.get(
+            profile_response = http_session.get(
                 "https://api.linkedin.com/v2/me",
                 headers={**headers, "Authorization": f"Bearer {LINKEDIN_ACCESS_TOKEN}"},  # Use full token for actual request
                 timeout=10
             )
-            logger.debug(f"LinkedIn profile API response status: {profile_response.status_code}")
+            logger.debug("LinkedIn profile API response status: %s", profile_response.status_code)
             profile_response.raise_for_status()
             
             user_data = profile_response.json()
             user_id = user_data.get("id")
-            logger.debug(f"LinkedIn profile response: {json.dumps(user_data, indent=2)}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("LinkedIn profile response: %s", json.dumps(user_data, indent=2))
             
             if not user_id:
                 logger.error("LinkedIn profile response missing 'id' field")
                 raise RuntimeError("Could not get user ID from LinkedIn profile")
             
             author = f"urn:li:person:{user_id}"
-            logger.debug(f"Using user author: {author}")
+            logger.debug("Using user author: %s", author)
         except Exception as e:
-            logger.error(f"Failed to get LinkedIn user profile: {type(e).__name__}: {e}", exc_info=True)
+            logger.error("Failed to get LinkedIn user profile: %s: %s", type(e).__name__, e, exc_info=logger.isEnabledFor(logging.DEBUG))
             raise RuntimeError("Could not determine LinkedIn author URN")
     
     # Build post payload
@@ -452,7 +457,8 @@ def post_to_linkedin(text: str, media_urls: List[str] = None) -> str:
         }
     }
     
-    logger.debug(f"LinkedIn post payload: {json.dumps(payload, indent=2)}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("LinkedIn post payload: %s", json.dumps(payload, indent=2))
     
     # If media URLs provided, upload and attach (simplified - LinkedIn media upload is complex)
     # For now, we'll just post text. Full media support requires multi-step upload process
@@ -461,24 +467,25 @@ def post_to_linkedin(text: str, media_urls: List[str] = None) -> str:
     
     # Post to LinkedIn
     logger.info(f"💼 Posting to LinkedIn (text length: {len(text)})")
-    logger.debug(f"LinkedIn text: {text}")
+    logger.debug("LinkedIn text: %s", text)
     
     try:
-        response = requests.post(
+        response = http_session.post(
             "https://api.linkedin.com/v2/ugcPosts",
             headers={**headers, "Authorization": f"Bearer {LINKEDIN_ACCESS_TOKEN}"},  # Use full token
             json=payload,
             timeout=15
         )
         
-        logger.debug(f"LinkedIn API response status: {response.status_code}")
-        logger.debug(f"LinkedIn API response headers: {dict(response.headers)}")
+        logger.debug("LinkedIn API response status: %s", response.status_code)
+        logger.debug("LinkedIn API response headers: %s", dict(response.headers))
         
         response.raise_for_status()
         
         # Extract post ID from response
         post_data = response.json()
-        logger.debug(f"LinkedIn post response: {json.dumps(post_data, indent=2)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("LinkedIn post response: %s", json.dumps(post_data, indent=2))
         
         post_id = post_data.get("id", "")
         
@@ -520,7 +527,7 @@ def post_to_linkedin(text: str, media_urls: List[str] = None) -> str:
             logger.error(f"Response body: {e.response.text}")
         raise
     except Exception as e:
-        logger.error(f"❌ Failed to post to LinkedIn: {type(e).__name__}: {e}", exc_info=True)
+        logger.error("❌ Failed to post to LinkedIn: %s: %s", type(e).__name__, e, exc_info=logger.isEnabledFor(logging.DEBUG))
         raise
 
 # ----- Main Posting Logic -----
@@ -581,20 +588,20 @@ def run(platform: str):
                 x_text = get_prop_text(page, "X Text").strip()
                 if x_text:
                     text = x_text
-                    logger.debug(f"Using X Text property: {len(text)} chars")
+                    logger.debug("Using X Text property: %d chars", len(text))
                 else:
                     text = get_prop_text(page, "Title").strip()
-                    logger.debug(f"X Text empty, using Title as fallback: {len(text)} chars")
+                    logger.debug("X Text empty, using Title as fallback: %d chars", len(text))
             elif platform == 'linkedin':
                 # Try LinkedIn Text property first
                 linkedin_text = get_prop_text(page, "LinkedIn Text").strip()
                 if linkedin_text:
                     text = linkedin_text
-                    logger.debug(f"Using LinkedIn Text property: {len(text)} chars")
+                    logger.debug("Using LinkedIn Text property: %d chars", len(text))
                 else:
                     # Fallback to Title if LinkedIn Text is empty
                     text = get_prop_text(page, "Title").strip()
-                    logger.debug(f"LinkedIn Text empty, using Title as fallback: {len(text)} chars")
+                    logger.debug("LinkedIn Text empty, using Title as fallback: %d chars", len(text))
             
             media_urls = get_media_urls(page)
             